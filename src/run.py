@@ -35,7 +35,8 @@ For usage examples, see the commands docs.
 from csv import DictReader, DictWriter
 from dataclasses import dataclass
 from datetime import date
-from pickle import load, dump
+from pathlib import Path
+from pickle import loads, dump, HIGHEST_PROTOCOL
 import sys
 
 import click
@@ -93,8 +94,7 @@ def read_db(db_filepath: str) -> list[UserExpense]:
         list[UserExpense]: A list of all expenses from the database.
     """
     if db_filepath.endswith('.db'):
-        with open(db_filepath, 'rb') as stream:
-            restored = load(stream)
+        restored = loads(Path(db_filepath).read_bytes())
         return restored
     else:
         raise TypeError('Missing extension for file or unsupported file type.')
@@ -185,7 +185,7 @@ def write_db(db_filepath: str, expenses: list[UserExpense]) -> None:
         None
     """
     with open(db_filepath, 'wb') as stream:
-        dump(expenses, stream)
+        dump(expenses, stream, HIGHEST_PROTOCOL)
 
 
 def sort_expenses(expenses: list[UserExpense], sort: str|None, descending: bool) -> list[UserExpense]:
@@ -312,7 +312,7 @@ def export_csv(csv_filepath: str, expenses: list[UserExpense]) -> None:
         None
     """
     headers = ['id_num', 'dt', 'amount', 'desc']
-    with open(csv_filepath, 'x', encoding='utf-8') as stream:
+    with open(csv_filepath, 'x', encoding='utf-8', newline='') as stream:
         writer = DictWriter(stream, fieldnames=headers)
         writer.writeheader()
         for expense in expenses:
@@ -569,6 +569,12 @@ def import_from(import_path: str, db_filepath: str, dt: str|None) -> None:
         print(f'ERROR: {exception.args[0]}')
         sys.exit(1)
 
+    try:
+        dt = generate_date(dt)
+    except ValueError:
+        print('ERROR: Invalid date format.')
+        sys.exit(2)
+
     try:
         expenses = read_db(db_filepath)
     except TypeError as exception:
@@ -590,12 +596,6 @@ def import_from(import_path: str, db_filepath: str, dt: str|None) -> None:
             print(f'ERROR: Invalid headers in {import_path}.')
             sys.exit(5)
     
-    try:
-        dt = generate_date(dt)
-    except ValueError:
-            print('ERROR: Invalid date format.')
-            sys.exit(2)
-
     for expense in file_content:
         
         id_num = generate_new_id_num(expenses)
@@ -0,0 +1,71 @@
+"""
+This script contains pytest fixtures shared by run.py tests.
+"""
+
+
+from datetime import date
+from shutil import copy, copyfile
+
+import pytest
+
+from tests.test_utils import seed_db, CSV_VALID, SEED_EXPENSES
+
+
+@pytest.fixture(scope='session')
+def base_csv(tmp_path_factory):
+    """
+    A csv file with one valid expense, written once per test session.
+    """
+    csv_filepath = tmp_path_factory.mktemp('tpl')/'file.csv'
+    csv_filepath.write_text(CSV_VALID, encoding='utf-8')
+    return csv_filepath
+
+
+@pytest.fixture
+def external_filepath(base_csv, tmp_path):
+    """
+    Path to a copy of the base csv file in the test's own directory.
+    """
+    return copy(base_csv, tmp_path/'file.csv')
+
+
+@pytest.fixture(scope='session')
+def seed_db_dir(tmp_path_factory):
+    """
+    A directory with every database from SEED_EXPENSES, pickled once per test session.
+    """
+    seed_dirpath = tmp_path_factory.mktemp('seeds')
+    for name, expenses in SEED_EXPENSES.items():
+        seed_db(db_filepath=seed_dirpath/f'{name}.db', expenses=expenses)
+    return seed_dirpath
+
+
+@pytest.fixture
+def seeded_db(seed_db_dir, tmp_path):
+    """
+    Copies the named seed database to the test's own directory and returns its path.
+
+    Usage:
+    db_filepath = seeded_db('edit')
+    """
+    def copy_seed(name):
+        return copyfile(seed_db_dir/f'{name}.db', tmp_path/'file.db')
+    return copy_seed
+
+
+class FixedDate(date):
+    """
+    A date whose today() always returns the same day.
+    """
+    @classmethod
+    def today(cls):
+        return cls(2024, 12, 23)
+
+
+@pytest.fixture
+def today_dt(monkeypatch):
+    """
+    Pins today's date in run.py and returns it in the database format.
+    """
+    monkeypatch.setattr('src.run.date', FixedDate)
+    return '23/12/2024'
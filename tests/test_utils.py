@@ -4,8 +4,30 @@ All args for a given function are the same as for the command it inits.
 """
 
 
+from pathlib import Path
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+
 from click.testing import CliRunner
-from src.run import cli
+from src.run import cli, UserExpense
+
+
+RUNNER = CliRunner()
+
+CSV_HEADERS_ONLY = 'amount,desc\n'
+CSV_VALID = 'amount,desc\n10,first expense\n'
+CSV_INVALID_HEADERS = 'inv_amount,inv_desc\n10,first expense\n'
+
+SEED_EXPENSES = {
+    'default': [UserExpense(id_num=1, dt='15/09/1857', amount=567, desc='first expension')],
+    'add': [UserExpense(id_num=1, dt='12/03/2023', amount=1.0, desc='first expense')],
+    'edit': [UserExpense(id_num=1, dt='13/03/2013', amount=50.0, desc='first expense')],
+    'sort': [
+        UserExpense(id_num=1, dt='13/11/1954', amount=124.65, desc='first expense'),
+        UserExpense(id_num=3, dt='02/05/1999', amount=499, desc='third expense'),
+        UserExpense(id_num=2, dt='12/09/2021', amount=300, desc='second expense')
+    ]
+}
+
 
 def init_add(amount, desc, db_filepath, dt):
     """
@@ -14,7 +36,7 @@ def init_add(amount, desc, db_filepath, dt):
     Usage:
     result = init_add(amount=amount, desc=desc, db_filepath=db_filepath, dt=dt)
     """
-    return CliRunner().invoke(cli, ['add', '--db-filepath', db_filepath, '--dt', dt, '--', amount, desc])
+    return RUNNER.invoke(cli, ['add', '--db-filepath', db_filepath, '--dt', dt, '--', amount, desc], catch_exceptions=False)
 
 
 def init_report(db_filepath, sort, descending, python):
@@ -29,7 +51,7 @@ def init_report(db_filepath, sort, descending, python):
         args.append('--descending')
     if python == True:
         args.append('--python')
-    return CliRunner().invoke(cli, args)
+    return RUNNER.invoke(cli, args, catch_exceptions=False)
 
 
 def init_edit(id_num, db_filepath, dt, amount, desc):
@@ -39,7 +61,7 @@ def init_edit(id_num, db_filepath, dt, amount, desc):
     Usage:
     result = init_edit(id_num=id_num, db_filepath=db_filepath, dt=dt, amount=amount, desc=desc)
     """
-    return CliRunner().invoke(cli, ['edit', id_num, '--db-filepath', db_filepath, '--dt', dt, '--amount', amount, '--desc', desc])
+    return RUNNER.invoke(cli, ['edit', id_num, '--db-filepath', db_filepath, '--dt', dt, '--amount', amount, '--desc', desc], catch_exceptions=False)
 
 
 def init_import_from(external_filepath, db_filepath, dt):
@@ -49,7 +71,7 @@ def init_import_from(external_filepath, db_filepath, dt):
     Usage:
     result = init_import_from(external_filepath=external_filepath, db_filepath=db_filepath, dt=dt)
     """
-    return CliRunner().invoke(cli, ['import-from', external_filepath, '--db-filepath', db_filepath, '--dt', dt])
+    return RUNNER.invoke(cli, ['import-from', str(external_filepath), '--db-filepath', db_filepath, '--dt', dt], catch_exceptions=False)
 
 
 def init_export_to(external_filepath, db_filepath):
@@ -59,4 +81,26 @@ def init_export_to(external_filepath, db_filepath):
     Usage:
     result = init_export_to(external_filepath=external_filepath, db_filepath=db_filepath)
     """
-    return CliRunner().invoke(cli, ['export-to', external_filepath, '--db-filepath', db_filepath])
+    return RUNNER.invoke(cli, ['export-to', str(external_filepath), '--db-filepath', db_filepath], catch_exceptions=False)
+
+
+def seed_db(db_filepath, expenses):
+    """
+    A function that writes expenses to the database file in the test environment.
+    The expenses are pickled in one call and written to the file at once.
+
+    Usage:
+    seed_db(db_filepath=db_filepath, expenses=expenses)
+    """
+    Path(db_filepath).write_bytes(dumps(expenses, protocol=HIGHEST_PROTOCOL))
+
+
+def restore_db(db_filepath):
+    """
+    A function that reads expenses from the database file in the test environment.
+    The file is read at once and unpickled from memory.
+
+    Usage:
+    restored = restore_db(db_filepath=db_filepath)
+    """
+    return loads(Path(db_filepath).read_bytes())